@@ -48,7 +48,7 @@ class MinecraftVersion(VersionSource):
         return version in specifier
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Versioned:
     """Base class for types which can behave differently based on a version source,
     which defaults to MinecraftVersion."""
@@ -61,7 +61,7 @@ class Versioned:
         return self.version_source.matches(self.version_spec)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IsVersion(Versioned):
     """Instances of this class are truthy if version_spec matches version_source, which
     defaults to MinecraftVersion.
@@ -119,7 +119,7 @@ After_1_20 = Annotated[_T, IsVersion(">1.20")]
 """Alias for `Annotated[_T, IsVersion("<1.20")]`."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValueIfVersion(Versioned, Generic[_If, _Else]):
     value_if: _If
     value_else: _Else
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
 from pathlib import Path
 from textwrap import dedent
@@ -33,6 +35,11 @@ logger = logging.getLogger(__name__)
 
 METADATA_SUFFIX = ".hexdoc.json"
 
+# don't bother spinning up a thread pool for just a handful of files
+_MIN_FILES_FOR_POOL = 8
+
+_JSON_SUFFIXES = frozenset({".json", ".json5"})
+
 
 _T = TypeVar("_T")
 _T_Model = TypeVar("_T_Model", bound=HexdocModel)
@@ -112,8 +119,11 @@ class ModResourceLoader:
         self._stack.close()
 
     def _map_own_assets(self, folder: str, *, root: str | Path):
+        # resolve symlinks in the root once; os.path.relpath is then pure string
+        # arithmetic, instead of Path.resolve statting every component per asset
+        root = os.path.realpath(root)
         return {
-            id: path.resolve().relative_to(root)
+            id: Path(os.path.relpath(path, root))
             for _, id, path in self.find_resources(
                 "assets",
                 namespace=self.props.modid,
@@ -137,14 +147,28 @@ class ModResourceLoader:
         """eg. `"{modid}.patterns"`"""
         metadata = dict[str, _T_Model]()
 
+        # str.format re-parses the pattern on every call; when {modid} is the only
+        # field (the common case), a plain substring replacement is enough
+        if "{" not in name_pattern.replace("{modid}", ""):
+
+            def format_name(modid: str) -> str:
+                return name_pattern.replace("{modid}", modid)
+
+        else:
+
+            def format_name(modid: str) -> str:
+                return name_pattern.format(modid=modid)
+
         # TODO: refactor
         cached_metadata = self.props.cache_dir / (
-            name_pattern.format(modid=self.props.modid) + METADATA_SUFFIX
+            format_name(self.props.modid) + METADATA_SUFFIX
         )
-        if cached_metadata.is_file():
+        try:
             metadata[self.props.modid] = model_type.model_validate_json(
                 cached_metadata.read_bytes()
             )
+        except FileNotFoundError:
+            pass
 
         for resource_dir in self.resource_dirs:
             # skip if the resource dir has no metadata set, because we're only loading
@@ -153,12 +177,11 @@ class ModResourceLoader:
             if modid is None or modid in metadata:
                 continue
 
+            # metadata files are 1:1 with their resource dir, so read directly
+            # instead of walking every resource dir again per modid
+            path = resource_dir.path / (format_name(modid) + METADATA_SUFFIX)
             try:
-                _, metadata[modid] = self.load_resource(
-                    Path(name_pattern.format(modid=modid) + METADATA_SUFFIX),
-                    decode=model_type.model_validate_json,
-                    export=False,
-                )
+                metadata[modid] = model_type.model_validate_json(path.read_bytes())
             except FileNotFoundError:
                 if allow_missing:
                     continue
@@ -188,7 +211,7 @@ class ModResourceLoader:
         )
 
         for book_id in books_to_check:
-            yield from self.load_resources(
+            yield from self.load_resources_batch(
                 type="assets" if use_resource_pack else "data",
                 folder=Path("patchouli_books") / book_id.path / lang / folder,
                 namespace=book_id.namespace,
@@ -202,7 +225,7 @@ class ModResourceLoader:
         folder: str | Path,
         id: ResourceLocation,
         *,
-        decode: Callable[[str], _T] = decode_json_dict,
+        decode: Callable[[str | bytes], _T] = decode_json_dict,
         export: ExportFn[_T] | Literal[False] | None = None,
     ) -> tuple[PathResourceDir, _T]:
         ...
@@ -213,7 +236,7 @@ class ModResourceLoader:
         path: Path,
         /,
         *,
-        decode: Callable[[str], _T] = decode_json_dict,
+        decode: Callable[[str | bytes], _T] = decode_json_dict,
         export: ExportFn[_T] | Literal[False] | None = None,
     ) -> tuple[PathResourceDir, _T]:
         ...
@@ -221,7 +244,7 @@ class ModResourceLoader:
     def load_resource(
         self,
         *args: Any,
-        decode: Callable[[str], _T] = decode_json_dict,
+        decode: Callable[[str | bytes], _T] = decode_json_dict,
         export: ExportFn[_T] | Literal[False] | None = None,
         **kwargs: Any,
     ) -> tuple[PathResourceDir, _T]:
@@ -277,9 +300,9 @@ class ModResourceLoader:
             path_stub = id.file_path_stub(type, folder)
 
         # check by descending priority, return the first that exists
+        path_key = path_stub.as_posix()
         for resource_dir in self.resource_dirs:
-            path = resource_dir.path / path_stub
-            if path.is_file():
+            if path := resource_dir.file_index.get(path_key):
                 return resource_dir, path
 
         raise FileNotFoundError(f"Path {path_stub} not found in any resource dir")
@@ -294,7 +317,7 @@ class ModResourceLoader:
         glob: str | list[str] = "**/*",
         allow_missing: bool = False,
         internal_only: bool = False,
-        decode: Callable[[str], _T] = decode_json_dict,
+        decode: Callable[[str | bytes], _T] = decode_json_dict,
         export: ExportFn[_T] | Literal[False] | None = None,
     ) -> Iterator[tuple[PathResourceDir, ResourceLocation, _T]]:
         ...
@@ -308,7 +331,7 @@ class ModResourceLoader:
         id: ResourceLocation,
         allow_missing: bool = False,
         internal_only: bool = False,
-        decode: Callable[[str], _T] = decode_json_dict,
+        decode: Callable[[str | bytes], _T] = decode_json_dict,
         export: ExportFn[_T] | Literal[False] | None = None,
     ) -> Iterator[tuple[PathResourceDir, ResourceLocation, _T]]:
         ...
@@ -317,7 +340,7 @@ class ModResourceLoader:
         self,
         type: ResourceType,
         *,
-        decode: Callable[[str], _T] = decode_json_dict,
+        decode: Callable[[str | bytes], _T] = decode_json_dict,
         export: ExportFn[_T] | Literal[False] | None = None,
         **kwargs: Any,
     ) -> Iterator[tuple[PathResourceDir, ResourceLocation, _T]]:
@@ -331,6 +354,39 @@ class ModResourceLoader:
             )
             yield resource_dir, value_id, value
 
+    def load_resources_batch(
+        self,
+        type: ResourceType,
+        *,
+        decode: Callable[[str | bytes], _T] = decode_json_dict,
+        export: ExportFn[_T] | Literal[False] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[tuple[PathResourceDir, ResourceLocation, _T]]:
+        """Like `load_resources`, but reads all of the files up front with a thread
+        pool instead of one at a time.
+
+        Decoding and reexporting still happen serially in priority order, so files
+        which override each other are exported deterministically.
+        """
+        found = list(self.find_resources(type, **kwargs))
+        paths = [path for _, _, path in found]
+
+        if len(found) >= _MIN_FILES_FOR_POOL:
+            with ThreadPoolExecutor() as executor:
+                all_data = list(executor.map(Path.read_bytes, paths))
+        else:
+            all_data = [path.read_bytes() for path in paths]
+
+        for (resource_dir, value_id, path), data in zip(found, all_data):
+            value = self._load_path(
+                resource_dir,
+                path,
+                data=data,
+                decode=decode,
+                export=export,
+            )
+            yield resource_dir, value_id, value
+
     @overload
     def find_resources(
         self,
@@ -403,35 +459,70 @@ class ModResourceLoader:
 
         # glob for json files if not provided
         globs = [glob] if isinstance(glob, str) else glob
-        for i in range(len(globs)):
-            if not Path(globs[i]).suffix:
-                globs[i] += ".json"
+        globs = [g if Path(g).suffix else g + ".json" for g in globs]
+
+        # drop duplicate patterns, preserving caller order: later globs take
+        # priority when they overlap (eg. *.flatten.json over *.json for lang files)
+        globs = list(dict.fromkeys(globs))
 
         # find all files matching the resloc
         found_any = False
+        base_depth = len(base_path_stub.parts)
+
+        # hoist lookups out of the hot loop below; it can run thousands of times
+        ResLoc = ResourceLocation
+        _Path = Path
+        _strip_suffixes = strip_suffixes
+
+        # eg. assets/*/lang/subdir/*.flatten.json5
+        patterns = [(base_path_stub / glob_).as_posix() for glob_ in globs]
+
+        # a non-wildcard namespace is the same for every match, so only matches of a
+        # wildcard need to read the namespace back out of the file path
+        literal_namespace = namespace if "*" not in namespace else None
+
         for resource_dir in reversed(self.resource_dirs):
             if internal_only and not resource_dir.internal:
                 continue
 
-            # eg. .../resources/assets/*/lang/subdir
-            for base_path in resource_dir.path.glob(base_path_stub.as_posix()):
-                for glob_ in globs:
-                    # eg. .../resources/assets/hexcasting/lang/subdir/*.flatten.json5
-                    for path in base_path.glob(glob_):
-                        # only strip json/json5, not eg. png
-                        id_path = path.relative_to(base_path)
-                        if "json" in path.name:
-                            id_path = strip_suffixes(id_path)
-
-                        id = ResourceLocation(
-                            # eg. ["assets", "hexcasting", "lang", ...][1]
-                            namespace=path.relative_to(resource_dir.path).parts[1],
-                            path=id_path.as_posix(),
-                        )
-
-                        if path.is_file():
-                            found_any = True
-                            yield resource_dir, id, path
+            # all patterns are matched in one pass over the file index, and cached
+            # per pattern since the same lookups tend to repeat (eg.
+            # _load_lang_resources for list_all then load_all)
+            buckets = resource_dir.find_files(patterns)
+
+            # when patterns overlap, yield each file only under its *last* matching
+            # pattern, so files loaded by a later glob are merged last and win (eg.
+            # en_us.flatten.json overriding en_us.json, which both match *.json)
+            last_match = None
+            if len(buckets) > 1:
+                last_match = {
+                    rel: i for i, matches in enumerate(buckets) for rel, _ in matches
+                }
+
+            for i, matches in enumerate(buckets):
+                for rel, path in matches:
+                    if last_match is not None and last_match[rel] != i:
+                        continue
+
+                    # only strip json/json5, not eg. png
+                    id_path = _Path(*_Path(rel).parts[base_depth:])
+                    if path.suffix in _JSON_SUFFIXES:
+                        if len(path.suffixes) == 1:
+                            # almost every file has a single suffix, skip the loop
+                            id_path = id_path.with_suffix("")
+                        else:
+                            # eg. en_us.flatten.json5
+                            id_path = _strip_suffixes(id_path)
+
+                    id = ResLoc(
+                        # eg. "assets/hexcasting/lang/..." -> "hexcasting"
+                        namespace=literal_namespace or rel.split("/", 2)[1],
+                        path=id_path.as_posix(),
+                    )
+
+                    # no is_file check needed, the index only contains files
+                    found_any = True
+                    yield resource_dir, id, path
 
         # if we never yielded any files, raise an error
         if not allow_missing and not found_any:
@@ -444,16 +535,15 @@ class ModResourceLoader:
         resource_dir: PathResourceDir,
         path: Path,
         *,
-        decode: Callable[[str], _T] = decode_json_dict,
+        data: bytes | None = None,
+        decode: Callable[[str | bytes], _T] = decode_json_dict,
         export: ExportFn[_T] | Literal[False] | None = None,
     ) -> _T:
-        if not path.is_file():
-            raise FileNotFoundError(path)
-
-        logger.debug(f"Loading {path}")
-
-        data = path.read_text("utf-8")
-        value = decode(data)
+        """Decodes and reexports a resource file. Pass `data` to skip reading it."""
+        if data is None:
+            data, value = self._read_and_decode(path, decode)
+        else:
+            value = decode(data)
 
         if resource_dir.reexport and export is not False:
             self.export(
@@ -466,8 +556,25 @@ class ModResourceLoader:
 
         return value
 
+    def _read_and_decode(
+        self,
+        path: Path,
+        decode: Callable[[str | bytes], _T],
+    ) -> tuple[bytes, _T]:
+        # no is_file check: paths come from the file index, and read_bytes raises
+        # FileNotFoundError itself if the file disappeared since then
+
+        # guard so the message isn't formatted at all when the level is disabled;
+        # this runs once per loaded file
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loading %s", path)
+
+        # read bytes so decoders can parse UTF-8 directly, without a str roundtrip
+        data = path.read_bytes()
+        return data, decode(data)
+
     @overload
-    def export(self, /, path: Path, data: str, *, cache: bool = False) -> None:
+    def export(self, /, path: Path, data: str | bytes, *, cache: bool = False) -> None:
         ...
 
     @overload
@@ -475,10 +582,10 @@ class ModResourceLoader:
         self,
         /,
         path: Path,
-        data: str,
+        data: str | bytes,
         value: _T,
         *,
-        decode: Callable[[str], _T] = decode_json_dict,
+        decode: Callable[[str | bytes], _T] = decode_json_dict,
         export: ExportFn[_T] | None = None,
         cache: bool = False,
     ) -> None:
@@ -487,10 +594,10 @@ class ModResourceLoader:
     def export(
         self,
         path: Path,
-        data: str,
+        data: str | bytes,
         value: _T = None,
         *,
-        decode: Callable[[str], _T] = decode_json_dict,
+        decode: Callable[[str | bytes], _T] = decode_json_dict,
         export: ExportFn[_T] | None = None,
         cache: bool = False,
     ) -> None:
@@ -498,12 +605,12 @@ class ModResourceLoader:
             return
         out_path = self.export_dir / path
 
-        logger.log(TRACE, f"Exporting {path} to {out_path}")
+        logger.log(TRACE, "Exporting %s to %s", path, out_path)
         if export is None:
             out_data = data
         else:
             try:
-                old_value = decode(out_path.read_text("utf-8"))
+                old_value = decode(out_path.read_bytes())
             except FileNotFoundError:
                 old_value = None
 
@@ -519,7 +626,7 @@ class ModResourceLoader:
             return
         out_path = self.export_dir / path
 
-        logger.log(TRACE, f"Exporting {path} to {out_path}")
+        logger.log(TRACE, "Exporting %s to %s", path, out_path)
         write_to_path(out_path, data)
 
     def __repr__(self):
@@ -7,6 +7,7 @@ from __future__ import annotations
 import logging
 import re
 from fnmatch import fnmatch
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any, ClassVar, Literal, Self
 
@@ -116,6 +117,7 @@ class ResourceLocation(BaseResourceLocation, regex=_make_regex()):
         return id
 
     @classmethod
+    @cache
     def from_file(cls, modid: str, base_dir: Path, path: Path) -> Self:
         resource_path = path.relative_to(base_dir).with_suffix("").as_posix()
         return cls(modid, resource_path)
@@ -149,6 +151,7 @@ class ResourceLocation(BaseResourceLocation, regex=_make_regex()):
     def match(self, pattern: Self) -> bool:
         return fnmatch(str(self), str(pattern))
 
+    @lru_cache
     def file_path_stub(
         self,
         type: ResourceType,
@@ -159,6 +162,9 @@ class ResourceLocation(BaseResourceLocation, regex=_make_regex()):
 
         If `assume_json` is True and no file extension is provided, `.json` is assumed.
 
+        The result is cached, since this does a fair amount of path arithmetic and is
+        called for every resource lookup.
+
         For example:
         ```py
         ResLoc("hexcasting", "thehexbook/book").file_path_stub("data", "patchouli_books")
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import os
+import re
 from abc import ABC, abstractmethod
 from contextlib import ExitStack, contextmanager
-from pathlib import Path
-from typing import Any, ContextManager, Iterable, Self
+from functools import cache, cached_property
+from pathlib import Path, PurePosixPath
+from typing import Any, ContextManager, Iterable, Self, Sequence
 
 import importlib_resources as resources
 from pydantic import ValidationInfo, field_validator, model_validator
@@ -15,6 +18,28 @@ from hexdoc.plugin import PluginManager
 from hexdoc.utils import RelativePath, relative_path_root
 
 
+@cache
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compiles a pathlib-style glob pattern to a regex matching relative posix paths.
+
+    Unlike `fnmatch.translate`, `*` and `?` don't cross path separators, and `**`
+    matches any number of nested directories (like `Path.glob`).
+    """
+    segments = list[str]()
+    for part in PurePosixPath(pattern).parts:
+        if part == "**":
+            segments.append(r"(?:[^/]+/)*")
+        else:
+            segments.append(
+                "".join(
+                    r"[^/]*" if c == "*" else r"[^/]" if c == "?" else re.escape(c)
+                    for c in part
+                )
+                + "/"
+            )
+    return re.compile("".join(segments).removesuffix("/") + r"\Z")
+
+
 class BaseResourceDir(HexdocModel, ABC):
     external: bool
     reexport: bool
@@ -50,6 +75,7 @@ class PathResourceDir(BaseResourceDir):
 
     # not a props field
     _modid: str | None = None
+    _match_cache: dict[str, list[tuple[str, Path]]] = {}
 
     @property
     def modid(self):
@@ -67,6 +93,64 @@ class PathResourceDir(BaseResourceDir):
     def load(self, pm: PluginManager):
         yield [self]
 
+    @cached_property
+    def file_index(self) -> dict[str, Path]:
+        """Maps the relative posix-style path of each file in this resource dir to its
+        full path.
+
+        Lazily built with a single `os.scandir` recursion on first access, so repeated
+        resource lookups can be served from memory instead of re-globbing the
+        filesystem. DirEntry carries the file type from the directory listing, so this
+        doesn't need to stat each file, and relative paths are computed by string
+        slicing instead of `Path.relative_to`.
+        """
+        index = dict[str, Path]()
+
+        root = str(self.path)
+        prefix_len = len(root) + 1  # +1 for the path separator
+
+        stack = [root]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    # don't follow directory symlinks, matching Path.glob
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        rel = entry.path[prefix_len:].replace(os.sep, "/")
+                        index[rel] = Path(entry.path)
+
+        return index
+
+    def find_files(self, patterns: Sequence[str]) -> list[list[tuple[str, Path]]]:
+        """Returns one list of `(relative posix path, full path)` pairs per glob
+        pattern, for files in this resource dir matching that pattern.
+
+        All uncached patterns are matched in a single pass over the file index (eg.
+        `I18n` asks for four lang globs at once), and results are cached per pattern,
+        since callers repeat the same lookups and the index is static for the lifetime
+        of this dir.
+        """
+        cache = self._match_cache
+        if missing := [p for p in dict.fromkeys(patterns) if p not in cache]:
+            matchers = [
+                (p, list[tuple[str, Path]](), _compile_glob(p).match) for p in missing
+            ]
+            for item in self.file_index.items():
+                for _, found, match in matchers:
+                    if match(item[0]):
+                        found.append(item)
+            # only publish completed lists, so duplicate patterns in one call (or a
+            # concurrent caller) can't observe empty or partially filled results
+            for pattern, found, _ in matchers:
+                cache[pattern] = found
+        return [cache[pattern] for pattern in patterns]
+
     @model_validator(mode="before")
     def _pre_root(cls: Any, value: Any):
         # treat plain strings as paths
@@ -1,7 +1,7 @@
 import base64
 import logging
 from collections.abc import Set
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Iterable, Iterator
 
@@ -34,6 +34,24 @@ logger = logging.getLogger(__name__)
 
 Texture = ImageTexture | ItemTexture
 
+# a multiple of 3, so each chunk encodes to base64 without padding
+_B64_CHUNK_SIZE = 3 * 2**16
+
+
+@lru_cache(maxsize=128)
+def _encode_texture_b64(path: Path, mtime_ns: int) -> str:
+    """Base64-encodes a file in chunks, to avoid holding the raw bytes, the encoded
+    bytes, and the decoded string in memory all at once.
+
+    Cached by path and mtime, because books tend to reference the same textures from
+    many entries.
+    """
+    encoded = bytearray()
+    with open(path, "rb") as f:
+        while chunk := f.read(_B64_CHUNK_SIZE):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode("ascii")
+
 
 class TextureNotFoundError(FileNotFoundError):
     def __init__(self, id_type: str, id: ResourceLocation):
@@ -46,15 +64,15 @@ class HexdocPythonResourceLoader(HexdocModel):
 
     def loadJSON(self, resource_path: ResourcePath) -> str:
         path = self._convert_resource_path(resource_path)
-        _, json_str = self.loader.load_resource(path, decode=lambda v: v)
-        return json_str
+        _, data = self.loader.load_resource(path, decode=lambda v: v)
+        if isinstance(data, bytes):
+            return data.decode("utf-8")
+        return data
 
     def loadTexture(self, resource_path: ResourcePath) -> str:
         path = self._convert_resource_path(resource_path)
         _, resolved_path = self.loader.find_resource(path)
-
-        with open(resolved_path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
+        return _encode_texture_b64(resolved_path, resolved_path.stat().st_mtime_ns)
 
     def close(self):
         pass
@@ -62,8 +80,14 @@ class HexdocPythonResourceLoader(HexdocModel):
     def wrapped(self):
         return js.PythonLoaderWrapper(self)
 
+    @cached_property
+    def _resource_path_as_string(self):
+        # every js.* access goes through minecraft_render's lazy module loader, and
+        # this one runs for every resource the renderer asks for, so resolve it once
+        return js.resourcePathAsString
+
     def _convert_resource_path(self, resource_path: ResourcePath):
-        string_path = js.resourcePathAsString(resource_path)
+        string_path = self._resource_path_as_string(resource_path)
         return Path("assets") / string_path
 
 
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
-from collections import defaultdict
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from typing import Any, Callable, Self
 
 from pydantic import ValidationInfo, model_validator
@@ -12,6 +11,7 @@ from pydantic.functional_validators import ModelWrapValidatorHandler
 from hexdoc.core import (
     ItemStack,
     LoaderContext,
+    MinecraftVersion,
     ModResourceLoader,
     ResourceLocation,
     ValueIfVersion,
@@ -22,6 +22,17 @@ from hexdoc.utils import cast_or_raise, decode_and_flatten_json_dict
 logger = logging.getLogger(__name__)
 
 
+# translates eg. "tea_ingredients/gloopy" to "tea ingredients, gloopy" in one pass
+_TAG_PATH_TABLE = str.maketrans({"_": " ", "/": ", "})
+
+
+@lru_cache(maxsize=1)
+def _pattern_key_group(version: str | None):
+    # keyed on the version so tests that change MinecraftVersion aren't stuck with
+    # a stale value, but still only evaluated once per version in practice
+    return ValueIfVersion(">=1.20", "action", "spell")()
+
+
 @total_ordering
 class LocalizedStr(HexdocModel, frozen=True):
     """Represents a string which has been localized."""
@@ -39,6 +50,15 @@ class LocalizedStr(HexdocModel, frozen=True):
         """Returns an instance of this class with an empty key."""
         return cls(key="", value=value)
 
+    @classmethod
+    def unchecked(cls, key: str, value: str) -> Self:
+        """Constructs an instance without validation, for trusted data.
+
+        Lang files produce one of these per translation key, so skipping Pydantic
+        validation is a significant win when loading large books.
+        """
+        return cls.model_construct(key=key, value=value)
+
     @model_validator(mode="wrap")
     @classmethod
     def _check_localize(
@@ -70,20 +90,24 @@ class LocalizedStr(HexdocModel, frozen=True):
         return self.value
 
     def __eq__(self, other: Self | str | Any):
-        match other:
-            case LocalizedStr():
-                return self.value == other.value
-            case str():
-                return self.value == other
-            case _:
-                return super().__eq__(other)
-
-    def __lt__(self, other: Self | str):
-        match other:
-            case LocalizedStr():
-                return self.value < other.value
-            case str():
-                return self.value < other
+        # isinstance instead of match: comparisons are hot in sorts and dict lookups
+        if isinstance(other, LocalizedStr):
+            return self.value == other.value
+        if isinstance(other, str):
+            return self.value == other
+        return super().__eq__(other)
+
+    def __hash__(self):
+        # only value matters for equality (including with plain strings), so the
+        # default frozen-model hash over both fields would be inconsistent
+        return hash(self.value)
+
+    def __lt__(self, other: object):
+        if isinstance(other, LocalizedStr):
+            return self.value < other.value
+        if isinstance(other, str):
+            return self.value < other
+        return NotImplemented
 
 
 class LocalizedItem(LocalizedStr, frozen=True):
@@ -95,10 +119,14 @@ class LocalizedItem(LocalizedStr, frozen=True):
 class I18n(HexdocModel):
     """Handles localization of strings."""
 
-    lookup: dict[str, LocalizedStr] | None
+    lookup: dict[str, str] | None
+    """Raw key -> value translation table. `LocalizedStr` objects are only built for
+    keys that actually get localized, since most lang entries are never looked up."""
     lang: str
     default_i18n: I18n | None
 
+    _localized_cache: dict[str, LocalizedStr] = {}
+
     @classmethod
     def list_all(cls, loader: ModResourceLoader):
         # don't list languages which this particular mod doesn't support
@@ -112,20 +140,17 @@ class I18n(HexdocModel):
     @classmethod
     def load_all(cls, loader: ModResourceLoader):
         # lang -> (key -> value)
-        lookups = defaultdict[str, dict[str, LocalizedStr]](dict)
+        lookups = dict[str, dict[str, str]]()
         internal_langs = set[str]()
 
         for resource_dir, lang_id, data in cls._load_lang_resources(loader):
             lang = lang_id.path
-            lookups[lang] |= {
-                key: LocalizedStr(key=key, value=value.replace("%%", "%"))
-                for key, value in data.items()
-            }
+            lookups.setdefault(lang, {}).update(data)
             if not resource_dir.external:
                 internal_langs.add(lang)
 
         default_lang = loader.props.default_lang
-        default_lookup = lookups[default_lang]
+        default_lookup = lookups.setdefault(default_lang, {})
         default_i18n = cls(
             lookup=default_lookup,
             lang=default_lang,
@@ -144,14 +169,11 @@ class I18n(HexdocModel):
 
     @classmethod
     def load(cls, loader: ModResourceLoader, lang: str) -> Self:
-        lookup = dict[str, LocalizedStr]()
+        lookup = dict[str, str]()
         is_internal = False
 
         for resource_dir, _, data in cls._load_lang_resources(loader, lang):
-            lookup |= {
-                key: LocalizedStr(key=key, value=value.replace("%%", "%"))
-                for key, value in data.items()
-            }
+            lookup.update(data)
             if not resource_dir.external:
                 is_internal = True
 
@@ -173,7 +195,8 @@ class I18n(HexdocModel):
 
     @classmethod
     def _load_lang_resources(cls, loader: ModResourceLoader, lang: str = "*"):
-        return loader.load_resources(
+        # lang files are the largest JSON a book loads, so batch the file reads
+        return loader.load_resources_batch(
             "assets",
             namespace="*",
             folder="lang",
@@ -189,7 +212,15 @@ class I18n(HexdocModel):
 
     @classmethod
     def _export(cls, new: dict[str, str], current: dict[str, str] | None):
-        return json.dumps((current or {}) | new)
+        # compact separators: lang files are by far the largest exported JSON
+        # sort_keys keeps the merged output stable regardless of load order, and
+        # ensure_ascii=False skips the escaping pass on non-ASCII translations
+        return json.dumps(
+            (current or {}) | new,
+            separators=(",", ":"),
+            sort_keys=True,
+            ensure_ascii=False,
+        )
 
     @property
     def is_default(self):
@@ -215,9 +246,16 @@ class I18n(HexdocModel):
         if self.lookup is None:
             return LocalizedStr.skip_i18n(keys[0])
 
+        cache = self._localized_cache
         for key in keys:
-            if key in self.lookup:
-                return self.lookup[key]
+            if (localized := cache.get(key)) is not None:
+                return localized
+            if (value := self.lookup.get(key)) is not None:
+                # most values contain no escape, so don't copy the string for nothing
+                if "%%" in value:
+                    value = value.replace("%%", "%")
+                localized = cache[key] = LocalizedStr.unchecked(key, value)
+                return localized
 
         logger.log(
             logging.DEBUG if silent else logging.ERROR,
@@ -233,6 +271,24 @@ class I18n(HexdocModel):
 
         return LocalizedStr.skip_i18n(keys[0])
 
+    def localize_one(self, key: str, silent: bool = False) -> LocalizedStr:
+        """Like `localize`, but specialized for the common case of a single key with
+        no default, which skips the fallback machinery entirely on a hit."""
+        if self.lookup is None:
+            return LocalizedStr.skip_i18n(key)
+
+        if (localized := self._localized_cache.get(key)) is not None:
+            return localized
+
+        if (value := self.lookup.get(key)) is not None:
+            if "%%" in value:
+                value = value.replace("%%", "%")
+            localized = self._localized_cache[key] = LocalizedStr.unchecked(key, value)
+            return localized
+
+        # misses are cold, let the general path handle logging and fallbacks
+        return self.localize(key, silent=silent)
+
     def localize_pattern(
         self,
         op_id: ResourceLocation,
@@ -242,7 +298,7 @@ class I18n(HexdocModel):
 
         Raises ValueError if i18n is enabled but the key has no localization.
         """
-        key_group = ValueIfVersion(">=1.20", "action", "spell")()
+        key_group = _pattern_key_group(MinecraftVersion.get())
 
         # prefer the book-specific translation if it exists
         return self.localize(
@@ -260,25 +316,22 @@ class I18n(HexdocModel):
 
         Raises ValueError if i18n is enabled but the key has no localization.
         """
-        match item:
-            case str():
-                item = ItemStack.from_str(item)
-            case ResourceLocation(namespace=namespace, path=path):
-                item = ItemStack(namespace=namespace, path=path)
-            case _:
-                pass
+        if isinstance(item, str):
+            item = ItemStack.from_str(item)
+        elif isinstance(item, ResourceLocation):
+            item = ItemStack(namespace=item.namespace, path=item.path)
 
         localized = self.localize(
             item.i18n_key(),
             item.i18n_key("block"),
             silent=silent,
         )
-        return LocalizedItem(key=localized.key, value=localized.value)
+        return LocalizedItem.unchecked(localized.key, localized.value)
 
     def localize_key(self, key: str, silent: bool = False) -> LocalizedStr:
         if not key.startswith("key."):
             key = "key." + key
-        return self.localize(key, silent=silent)
+        return self.localize_one(key, silent=silent)
 
     def localize_item_tag(self, tag: ResourceLocation, silent: bool = False):
         localized = self.localize(
@@ -288,7 +341,7 @@ class I18n(HexdocModel):
             default=self.fallback_tag_name(tag),
             silent=silent,
         )
-        return LocalizedStr(key=localized.key, value=f"Tag: {localized.value}")
+        return LocalizedStr.unchecked(localized.key, f"Tag: {localized.value}")
 
     def fallback_tag_name(self, tag: ResourceLocation):
         """Generates a more-or-less reasonable fallback name for a tag.
@@ -299,11 +352,11 @@ class I18n(HexdocModel):
         * `c:tea_ingredients/gloopy/weak` -> Tea Ingredients, Gloopy, Weak
         """
 
-        if tag.path.count("/") == 1:
-            before, after = tag.path.split("/")
+        before, sep, after = tag.path.partition("/")
+        if sep and "/" not in after:
             return f"{after} {before}".title()
 
-        return tag.path.replace("_", " ").replace("/", ", ").title()
+        return tag.path.translate(_TAG_PATH_TABLE).title()
 
     def localize_texture(self, texture_id: ResourceLocation, silent: bool = False):
         path = texture_id.path.removeprefix("textures/").removesuffix(".png")
@@ -313,11 +366,11 @@ class I18n(HexdocModel):
         if root == "mob_effect":
             root = "effect"
 
-        return self.localize(f"{root}.{texture_id.namespace}.{rest}", silent=silent)
+        return self.localize_one(f"{root}.{texture_id.namespace}.{rest}", silent=silent)
 
     def localize_lang(self, silent: bool = False):
-        name = self.localize("language.name", silent=silent)
-        region = self.localize("language.region", silent=silent)
+        name = self.localize_one("language.name", silent=silent)
+        region = self.localize_one("language.region", silent=silent)
         return f"{name} ({region})"
 
 
@@ -11,7 +11,7 @@ from hexdoc.model import HexdocModel
 from hexdoc.utils import PydanticOrderedSet, decode_json_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class TagLoader:
     namespace: str
     registry: str
@@ -82,7 +82,7 @@ class Tag(HexdocModel):
         return cls(registry=registry, values=values, replace=replace)
 
     @classmethod
-    def _convert(cls, *, registry: str, raw_data: str) -> Self:
+    def _convert(cls, *, registry: str, raw_data: str | bytes) -> Self:
         data = decode_json_dict(raw_data)
         return cls.model_validate(data | {"registry": registry})
 
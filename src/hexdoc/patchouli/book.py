@@ -1,4 +1,5 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal, Mapping, Self
 
 from pydantic import Field, PrivateAttr, ValidationInfo, model_validator
@@ -9,18 +10,22 @@ from hexdoc.core import (
     IsVersion,
     ItemStack,
     ModResourceLoader,
+    PathResourceDir,
     ResLoc,
     ResourceLocation,
 )
 from hexdoc.minecraft import LocalizedStr
 from hexdoc.model import Color, HexdocModel
-from hexdoc.utils import cast_or_raise, sorted_dict
+from hexdoc.utils import JSONDict, cast_or_raise, sorted_dict
 
 from .book_context import BookContext
 from .category import Category
 from .entry import Entry
 from .text import BookLinkBases, FormatTree
 
+# don't bother spinning up a thread pool for books with only a handful of entries
+_MIN_ENTRIES_FOR_POOL = 8
+
 
 class Book(HexdocModel):
     """Main Patchouli book class.
@@ -123,13 +128,30 @@ class Book(HexdocModel):
     def _load_entries(self, context: BookContext):
         internal_entries = defaultdict[ResLoc, dict[ResLoc, Entry]](dict)
 
-        for resource_dir, id, data in context.loader.load_book_assets(
-            parent_book_id=self.id,
-            folder="entries",
-            use_resource_pack=self.use_resource_pack,
-        ):
-            entry = Entry.load(resource_dir, id, data, context)
-
+        assets = list(
+            context.loader.load_book_assets(
+                parent_book_id=self.id,
+                folder="entries",
+                use_resource_pack=self.use_resource_pack,
+            )
+        )
+
+        def load_entry(
+            asset: tuple[PathResourceDir, ResourceLocation, JSONDict],
+        ) -> Entry:
+            resource_dir, id, data = asset
+            return Entry.load(resource_dir, id, data, context)
+
+        # each entry is validated independently, so fan the loads out to a thread
+        # pool; the shared bookkeeping below stays serial and deterministic because
+        # map() preserves input order
+        if len(assets) >= _MIN_ENTRIES_FOR_POOL:
+            with ThreadPoolExecutor() as executor:
+                entries = list(executor.map(load_entry, assets))
+        else:
+            entries = [load_entry(asset) for asset in assets]
+
+        for (resource_dir, id, _), entry in zip(assets, entries):
             # i used the entry to insert the entry (pretty sure thanos said that)
             if resource_dir.internal:
                 internal_entries[entry.category_id][entry.id] = entry
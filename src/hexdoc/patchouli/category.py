@@ -28,6 +28,7 @@ class Category(IDModel, Sortable):
     # optional
     parent_id: ResourceLocation | None = Field(default=None, alias="parent")
     _parent_cmp_key: tuple[int, ...] | None = None
+    _cached_cmp_key: tuple[int, ...] | None = None
     flag: str | None = None
     sortnum: int = 0
     secret: bool = False
@@ -87,6 +88,16 @@ class Category(IDModel, Sortable):
     @property
     def _cmp_key(self) -> tuple[int, ...]:
         # implement Sortable
+        # this is recomputed for every comparison while sorting, so cache it
+        # (only after _parent_cmp_key is ready, or we'd cache an incomplete key)
+        if cmp_key := self._cached_cmp_key:
+            return cmp_key
+
         if parent_cmp_key := self._parent_cmp_key:
-            return parent_cmp_key + (self.sortnum,)
-        return (self.sortnum,)
+            cmp_key = parent_cmp_key + (self.sortnum,)
+        else:
+            cmp_key = (self.sortnum,)
+
+        if self._is_cmp_key_ready:
+            self._cached_cmp_key = cmp_key
+        return cmp_key
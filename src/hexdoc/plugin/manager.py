@@ -43,7 +43,7 @@ class PluginNotFoundError(RuntimeError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TypedHookCaller(Generic[_P, _R]):
     plugin_name: str | None
     caller: pluggy.HookCaller
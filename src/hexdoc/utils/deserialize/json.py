@@ -24,7 +24,10 @@ def decode_json_dict(data: str | bytes) -> JSONDict:
 
 # implement pkpcpbp's flattening in python
 # https://github.com/gamma-delta/PKPCPBP/blob/786194a590f/src/main/java/at/petrak/pkpcpbp/filters/JsonUtil.java
-def decode_and_flatten_json_dict(data: str) -> dict[str, str]:
+def decode_and_flatten_json_dict(data: str | bytes) -> dict[str, str]:
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+
     # replace `\<LF>       foobar` with `\<LF>foobar`
     data = re.sub(r"\\\n\s*", "\\\n", data)
 
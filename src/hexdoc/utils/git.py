@@ -1,13 +1,20 @@
-import subprocess
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def git_root(cwd: str | Path) -> Path:
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        cwd=cwd,
-        capture_output=True,
-        encoding="utf-8",
-        check=True,
-    )
-    return Path(result.stdout.strip())
+    """Returns the root of the Git repository containing `cwd`.
+
+    Walks upward looking for a `.git` entry instead of shelling out to
+    `git rev-parse`, which avoids paying process startup costs; the result is
+    cached per `cwd`.
+
+    Raises FileNotFoundError if `cwd` is not inside a Git repository.
+    """
+    path = Path(cwd).resolve()
+    for parent in [path, *path.parents]:
+        # .git may be a file for submodules/worktrees
+        if (parent / ".git").exists():
+            return parent
+    raise FileNotFoundError(f"Not inside a Git repository: {cwd}")
@@ -37,7 +37,7 @@ def replace_suffixes(path: Path, suffix: str) -> Path:
 
 
 def write_to_path(path: Path, data: str | bytes, encoding: str = "utf-8"):
-    logger.log(TRACE, f"Writing to {path}")
+    logger.log(TRACE, "Writing to %s", path)
     path.parent.mkdir(parents=True, exist_ok=True)
     match data:
         case str():
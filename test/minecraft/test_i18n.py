@@ -1,5 +1,11 @@
+import json
+from contextlib import ExitStack
+from pathlib import Path
+
 import pytest
-from hexdoc.core import ResourceLocation
+from hexdoc.core import ModResourceLoader, ResourceLocation
+from hexdoc.core.properties import Properties
+from hexdoc.core.resource_dir import PathResourceDir
 from hexdoc.minecraft import I18n
 
 
@@ -23,3 +29,54 @@ def test_fallback_tag_name(namespace: str, path: str, want: str):
     got = i18n.localize_item_tag(tag)
 
     assert got.value == f"Tag: {want}"
+
+
+@pytest.mark.parametrize(
+    "index_order",
+    [
+        ["en_us.json", "en_us.flatten.json"],
+        ["en_us.flatten.json", "en_us.json"],
+    ],
+)
+def test_flatten_overrides_plain_lang(
+    tmp_path: Path,
+    index_order: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    lang_dir = tmp_path / "assets" / "testmod" / "lang"
+    lang_dir.mkdir(parents=True)
+
+    # both of these match the en_us.json glob, but the flatten file is loaded by a
+    # later glob in _load_lang_resources, so its value should win the merge
+    with open(lang_dir / "en_us.json", "w") as f:
+        json.dump({"test.key": "plain"}, f)
+    with open(lang_dir / "en_us.flatten.json", "w") as f:
+        json.dump({"test.key": "flatten"}, f)
+
+    # pre-seed the file index: merge priority must come from glob order, not from
+    # whichever file the directory listing happens to yield first
+    index = {f"assets/testmod/lang/{name}": lang_dir / name for name in index_order}
+
+    def fake_file_index(self: PathResourceDir) -> dict[str, Path]:
+        return index
+
+    monkeypatch.setattr(PathResourceDir, "file_index", property(fake_file_index))
+
+    resource_dirs = [PathResourceDir.model_construct(path=tmp_path)]
+    props = Properties.model_construct(
+        modid="testmod",
+        default_lang="en_us",
+        resource_dirs=resource_dirs,
+    )
+
+    with ExitStack() as stack:
+        loader = ModResourceLoader(
+            props=props,
+            export_dir=None,
+            resource_dirs=resource_dirs,
+            _stack=stack,
+        )
+        # load_all globs with a wildcard lang, so both files match the *.json glob
+        i18n = I18n.load_all(loader)["en_us"]
+
+    assert i18n.localize("test.key").value == "flatten"